@@ -0,0 +1,370 @@
+"""
+Command-line entry point of the demo.
+
+Usage:
+    python -m cli convert data.txt --delimiter ';' --target mass -o data.csv
+    python -m cli fit data.csv -o model.json
+    python -m cli predict model.json inputs.csv
+    python -m cli generate 3d --size 100 -o plane.csv
+    python -m cli plot 3d
+    python -m cli bench data.csv --repeat 20
+
+Only the standard library and the pure python modules of the demo
+are imported at module level. numpy, scikit-learn and matplotlib are
+imported inside the subcommands that need them, so that fit and
+predict do not pay for loading them.
+"""
+import argparse
+import csv
+import json
+import math
+import sys
+import time
+from typing import (List, Optional, TextIO)
+
+
+def read_text(path: str) -> str:
+    """
+    Read a whole text file, '-' meaning the standard input.
+
+    :param path: path of the file to read.
+    :return: the content of the file.
+    """
+    if path == "-":
+        return sys.stdin.read()
+    with open(path, newline="") as f:
+        return f.read()
+
+
+def open_input(path: str) -> TextIO:
+    """
+    Open the input stream of a subcommand, to be read by csv.reader.
+
+    :param path: path of the file to read, '-' for the standard input.
+    :return: a readable text stream.
+    """
+    if path == "-":
+        return sys.stdin
+    return open(path, newline="")
+
+
+def open_output(path: Optional[str]) -> TextIO:
+    """
+    Open the output stream of a subcommand.
+
+    :param path: path of the file to write, None or '-' for the standard output.
+    :return: a writable text stream.
+    """
+    if path is None or path == "-":
+        return sys.stdout
+    return open(path, "w", newline="")
+
+
+def fail(message: str) -> int:
+    """
+    Report an error of a subcommand on the standard error.
+
+    :param message: description of the error.
+    :return: the exit status of the subcommand.
+    """
+    print("error: {}".format(message), file=sys.stderr)
+    return 1
+
+
+def write_rows(path: Optional[str], header: List[str], rows):
+    """
+    Write a CSV document.
+
+    :param path: path of the file to write, None or '-' for the standard output.
+    :param header: names of the columns.
+    :param rows: iterable over the rows of values.
+    """
+    out = open_output(path)
+    try:
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(header)
+        writer.writerows(rows)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+def convert(args: argparse.Namespace) -> int:
+    """
+    Convert a delimited file into the CSV layout read by Dataset.from_csv:
+    comma separated, header line, target variable in the last column.
+    """
+    f = open_input(args.input)
+    try:
+        doc = csv.reader(f, delimiter=args.delimiter)
+        header = next(doc, None)
+        if header is None:
+            return fail("the input is empty")
+        header = [name.strip() for name in header]
+        if args.target is None:
+            target = len(header) - 1
+        elif args.target in header:
+            target = header.index(args.target)
+        else:
+            return fail("unknown target column '{}', the columns are: {}"
+                        .format(args.target, ", ".join(header)))
+        order = [i for i in range(len(header)) if i != target] + [target]
+        rows = []
+        for row in doc:
+            if not "".join(row).strip():
+                continue
+            if len(row) != len(header):
+                return fail("line {}: expected {} values, got {}".format(doc.line_num, len(header), len(row)))
+            rows.append([row[i].strip() for i in order])
+    finally:
+        if f is not sys.stdin:
+            f.close()
+    write_rows(args.output, [header[i] for i in order], rows)
+    return 0
+
+
+def fit_sklearn(dataset) -> (List[float], float):
+    """
+    Fit a linear model with scikit-learn.
+
+    :param dataset: the training data.
+    :return: the coefficients and the intercept of the model.
+    """
+    from sklearn.linear_model import LinearRegression
+
+    model = LinearRegression(fit_intercept=True)
+    model.fit([list(e.inputs) for e in dataset.experiments],
+              [e.output for e in dataset.experiments])
+    return [float(c) for c in model.coef_], float(model.intercept_)
+
+
+def fit(args: argparse.Namespace) -> int:
+    """
+    Fit a linear model on a CSV data set and save its coefficients as JSON.
+    """
+    from data import Dataset
+    from regression import fit_linear
+
+    try:
+        dataset = Dataset.from_csv(read_text(args.input))
+    except ValueError as e:
+        return fail(str(e))
+    if not dataset.experiments:
+        return fail("the data set has no rows")
+    model = {"features": dataset.features}
+    if args.sklearn:
+        model["coefficients"], model["intercept"] = fit_sklearn(dataset)
+    else:
+        rho, sqr_err, nb_iter = fit_linear(dataset, lambdaa=args.rate,
+                                           max_iter=args.max_iter,
+                                           threshold=args.threshold)
+        model.update(coefficients=list(rho), intercept=0.,
+                     square_error=sqr_err, iterations=nb_iter)
+        if not all(math.isfinite(v) for v in [sqr_err] + model["coefficients"]):
+            return fail("the gradient descent diverged after {} iterations, "
+                        "try a smaller --rate".format(nb_iter))
+
+    out = open_output(args.output)
+    try:
+        json.dump(model, out, indent=2, allow_nan=False)
+        out.write("\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def predict(args: argparse.Namespace) -> int:
+    """
+    Apply a model saved by the fit subcommand to the rows of a CSV file.
+
+    Columns are matched to the features of the model by name, other
+    columns are copied to the output untouched.
+    """
+    from data import Vector
+
+    with open(args.model) as f:
+        model = json.load(f)
+    rho = Vector(*model["coefficients"])
+    intercept = model.get("intercept", 0.)
+
+    f = open_input(args.input)
+    try:
+        doc = csv.reader(f)
+        header = next(doc, None)
+        if header is None:
+            return fail("the input is empty")
+        try:
+            columns = [header.index(feature) for feature in model["features"]]
+        except ValueError:
+            return fail("the input must have the columns: {}"
+                        .format(", ".join(model["features"])))
+
+        rows = []
+        for row in doc:
+            if not "".join(row).strip():
+                continue
+            try:
+                inputs = Vector(*[float(row[i]) for i in columns])
+            except IndexError:
+                return fail("line {}: expected {} values, got {}".format(doc.line_num, len(header), len(row)))
+            except ValueError as e:
+                return fail("line {}: {}".format(doc.line_num, e))
+            rows.append(row + [rho * inputs + intercept])
+    finally:
+        if f is not sys.stdin:
+            f.close()
+    write_rows(args.output, header + [args.name], rows)
+    return 0
+
+
+def generate(args: argparse.Namespace) -> int:
+    """
+    Generate one of the synthetic data sets of the demos as CSV.
+    """
+    import generators
+
+    if args.kind == "2d":
+        x, y = generators.generate_data_set(size=args.size)
+        write_rows(args.output, ["x", "y"], zip(x.ravel(), y.ravel()))
+    else:
+        from equations import PlaneEquation
+
+        equation = PlaneEquation(*args.plane)
+        x1, x2, y = generators.generate_data(equation, size=args.size)
+        write_rows(args.output, ["x1", "x2", "y"], zip(x1, x2, y))
+    return 0
+
+
+def plot(args: argparse.Namespace) -> int:
+    """
+    Run one of the plotting demos.
+    """
+    if args.kind == "2d":
+        import plot_regression_2d as demo
+    elif args.kind == "3d":
+        import plot_regression_3d as demo
+    else:
+        import plot_3_lines_crossing_2d as demo
+    demo.main()
+    return 0
+
+
+def bench(args: argparse.Namespace) -> int:
+    """
+    Time the parsing of a CSV data set and the fitting of a model on it.
+    """
+    from data import Dataset
+    from regression import fit_linear
+
+    csv_str = read_text(args.input)
+
+    def measure(label: str, func):
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        print("{:<12} min {:10.3f} ms   mean {:10.3f} ms".format(
+            label, min(timings) * 1e3, sum(timings) / len(timings) * 1e3))
+
+    try:
+        dataset = Dataset.from_csv(csv_str)
+    except ValueError as e:
+        return fail(str(e))
+    if not dataset.experiments:
+        return fail("the data set has no rows")
+    measure("parse", lambda: Dataset.from_csv(csv_str))
+    measure("fit", lambda: fit_linear(dataset, lambdaa=args.rate,
+                                      max_iter=args.max_iter,
+                                      threshold=args.threshold))
+    if args.sklearn:
+        start = time.perf_counter()
+        import sklearn.linear_model  # noqa: F401
+        print("{:<12} {:14.3f} ms".format("sklearn load", (time.perf_counter() - start) * 1e3))
+        measure("fit sklearn", lambda: fit_sklearn(dataset))
+    return 0
+
+
+def positive_int(value: str) -> int:
+    """
+    Argument type of the options that count something, such as --repeat.
+
+    :param value: the value given on the command line.
+    :return: the value as a strictly positive integer.
+    """
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError("{} is not a positive integer".format(value))
+    return number
+
+
+def add_fit_arguments(parser: argparse.ArgumentParser):
+    """
+    Add the parameters of the gradient descent to a subcommand.
+    """
+    parser.add_argument("--rate", type=float, default=0.1,
+                        help="learning rate of the gradient descent (default: %(default)s)")
+    parser.add_argument("--max-iter", type=int, default=10000,
+                        help="maximum number of iterations (default: %(default)s)")
+    parser.add_argument("--threshold", type=float, default=0.11,
+                        help="stop when the square error changes less than this "
+                             "(default: %(default)s)")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m cli", description=__doc__.split("\n\n")[0].strip())
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+    subparsers.required = True
+
+    sub = subparsers.add_parser("convert", help="convert a delimited file to the data set CSV layout")
+    sub.add_argument("input", help="file to convert, '-' for stdin")
+    sub.add_argument("-o", "--output", help="output file (default: stdout)")
+    sub.add_argument("-d", "--delimiter", default=",", help="delimiter of the input (default: '%(default)s')")
+    sub.add_argument("-t", "--target", help="name of the target column (default: last column)")
+    sub.set_defaults(func=convert)
+
+    sub = subparsers.add_parser("fit", help="fit a linear model on a CSV data set")
+    sub.add_argument("input", help="CSV data set, '-' for stdin")
+    sub.add_argument("-o", "--output", help="JSON model file (default: stdout)")
+    sub.add_argument("--sklearn", action="store_true",
+                     help="fit with scikit-learn instead of the gradient descent")
+    add_fit_arguments(sub)
+    sub.set_defaults(func=fit)
+
+    sub = subparsers.add_parser("predict", help="apply a fitted model to a CSV file")
+    sub.add_argument("model", help="JSON model file written by fit")
+    sub.add_argument("input", help="CSV file of inputs, '-' for stdin")
+    sub.add_argument("-o", "--output", help="output file (default: stdout)")
+    sub.add_argument("--name", default="prediction", help="name of the predicted column (default: %(default)s)")
+    sub.set_defaults(func=predict)
+
+    sub = subparsers.add_parser("generate", help="generate a synthetic data set")
+    sub.add_argument("kind", choices=["2d", "3d"], help="points close to a line (2d) or to a plane (3d)")
+    sub.add_argument("-o", "--output", help="output file (default: stdout)")
+    sub.add_argument("--size", type=int, default=50, help="number of points (default: %(default)s)")
+    sub.add_argument("--plane", type=float, nargs=4, default=[10, 2, -10, 5], metavar=("A", "B", "C", "D"),
+                     help="coefficients of the plane ax + by + cz + d = 0 for 3d (default: 10 2 -10 5)")
+    sub.set_defaults(func=generate)
+
+    sub = subparsers.add_parser("plot", help="run one of the plotting demos")
+    sub.add_argument("kind", choices=["2d", "3d", "lines"])
+    sub.set_defaults(func=plot)
+
+    sub = subparsers.add_parser("bench", help="time parsing and fitting of a CSV data set")
+    sub.add_argument("input", help="CSV data set, '-' for stdin")
+    sub.add_argument("--repeat", type=positive_int, default=10, help="number of runs (default: %(default)s)")
+    sub.add_argument("--sklearn", action="store_true", help="also time scikit-learn")
+    add_fit_arguments(sub)
+    sub.set_defaults(func=bench)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
 import csv
+import io
 from typing import (List, Union)
 from numbers import Number
 
@@ -85,8 +86,9 @@ class Dataset:
     Represents a dataset as a collection of observations (experiments).
     """
 
-    features: list = []
-    experiments: List[Experiment] = []
+    def __init__(self):
+        self.features: list = []
+        self.experiments: List[Experiment] = []
 
     def __iter__(self) -> 'Dataset':
         self.iterator = iter(self.experiments)
@@ -101,11 +103,22 @@ class Dataset:
     @staticmethod
     def from_csv(csv_str: str) -> 'Dataset':
         dataset = Dataset()
-        doc = csv.reader(csv_str.split("\n"))
-        dataset.features = list(next(doc)[:-1])
+        doc = csv.reader(io.StringIO(csv_str, newline=""))
+        header = next(doc, None)
+        if header is None:
+            raise ValueError("the data set is empty")
+        dataset.features = list(header[:-1])
         for row in doc:
-            inputs = Vector(*[float(v) for v in row[:-1]])
-            output = float(row[-1])
+            if not "".join(row).strip():
+                continue
+            if len(row) != len(dataset.features) + 1:
+                raise ValueError("line {}: expected {} values, got {}".format(
+                    doc.line_num, len(dataset.features) + 1, len(row)))
+            try:
+                inputs = Vector(*[float(v) for v in row[:-1]])
+                output = float(row[-1])
+            except ValueError as e:
+                raise ValueError("line {}: {}".format(doc.line_num, e)) from e
             dataset.experiments.append(
                 Experiment(inputs, output))
         return dataset
@@ -115,3 +128,19 @@ if __name__ == "__main__":
     print(2 * Vector(1, 1) + Vector(1, 2)) # expected: [3, 4]
     print(Vector(1, 1) * Vector(1, 2)) # expected: 3
     print(Vector(1, 1) - Vector(1, 2)) # expected: [0, -1]
+
+    csv_str = "a,b,y\n1,2,3\n4,5,6\n \n"
+    first, second = Dataset.from_csv(csv_str), Dataset.from_csv(csv_str)
+    assert len(first.experiments) == len(second.experiments) == 2
+    assert first.experiments is not second.experiments
+    assert first.features == ["a", "b"]
+    assert list(second[1].inputs) == [4., 5.] and second[1].output == 6.
+    quoted = Dataset.from_csv('"a\nb",y\n"1",2\n')
+    assert quoted.features == ["a\nb"] and quoted[0].output == 2.
+    for bad_csv in ("a,b,y\n1,2,3\n4,5\n", "a,b,y\n1,2,3\n4,x,6\n"):
+        try:
+            Dataset.from_csv(bad_csv)
+        except ValueError as e:
+            assert str(e).startswith("line 3:"), e
+        else:
+            raise AssertionError("no error raised for {!r}".format(bad_csv))
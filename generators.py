@@ -0,0 +1,88 @@
+"""
+Generate and partition the synthetic data sets used by the demos.
+
+Only depends on numpy, so that it can be used without
+loading matplotlib or scikit-learn.
+"""
+import numpy
+
+from equations import PlaneEquation
+
+
+def generate_data_set(size=50, seed_x=123, seed_y=321):
+    """
+    Generate data points lying close to a line.
+
+    :param size: the desired size of the generate data set.
+    :param seed_x: seed for random noise to add to the x coordinates of the generated data
+    :param seed_y: seed for random noise to add to the y coordinates of the generated data
+    :return: x, y values as column vectors numpy.ndarray
+    """
+    numpy.random.seed(seed_x)
+    x = numpy.linspace(0, size, size) + numpy.random.uniform(-size * 0.1, size * 0.1, size)
+    numpy.random.seed(seed_y)
+    y = numpy.linspace(0, size, size) + numpy.random.uniform(-size * 0.1, size * 0.1, size)
+    return x.reshape(-1, 1), y.reshape(-1, 1)
+
+
+def partition_data(x: numpy.ndarray, y: numpy.ndarray) -> (numpy.ndarray, numpy.ndarray,
+                                                           numpy.ndarray, numpy.ndarray):
+    """
+    Partition the data set into 3 clusters by
+    sampling 1 third of the data for each of
+    the training set, the test set and the validation set.
+
+    :param x: values of the feature, or input data
+    :param y: values of the target variable
+    :return: slices of the data set as x_train, y_train, x_test, y_test
+    """
+    size = x.shape[0]
+    step = 3
+    x_train = x[:size:step]
+    y_train = y[:size:step]
+    x_test = x[1:size:step]
+    y_test = y[1:size:step]
+    return x_train, y_train, x_test, y_test
+
+
+def generate_data(equation: PlaneEquation, size=50, seed_x=123, seed_y=321, seed_z=1885):
+    """
+    Generate data points lying close to a plane.
+
+    :param equation: function that calculates the z coordinate of the
+    points of a plane given their x and y coordinates.
+    :param size: the desired size of the generate data set.
+    :param seed_x: seed for random noise to add to the x coordinates of the generated data
+    :param seed_y: seed for random noise to add to the y coordinates of the generated data
+    :param seed_z: seed for random noise to add to the z coordinates of the generated data
+    :return: x, y, z values as numpy.ndarray
+    """
+    numpy.random.seed(seed_x)
+    x = numpy.linspace(0, size, size) + numpy.random.uniform(-size * 0.1, size * 0.1, size)
+    numpy.random.seed(seed_y)
+    y = numpy.linspace(0, size, size) + numpy.random.uniform(-size * 0.1, size * 0.1, size)
+    numpy.random.seed(seed_z)
+    z = equation(x, y) + numpy.random.uniform(-size * 0.2, size * 0.2, size)
+    return x, y, z
+
+
+def get_training_data(x: numpy.ndarray,
+                      y: numpy.ndarray,
+                      percent=20) -> (numpy.ndarray, numpy.ndarray):
+    """
+    Sample the data set at regular steps so as to get a
+    part of the data to use as the training set.
+
+    :param x: the features or inputs of the data set,. x has the shape:
+    [[x11, x12],
+     [x21, x22]
+     ...
+     [xn1, xn2]]
+    :param y: the outputs from the training set. y is just a flat array.
+    :param percent: percent of the data set to use for training.
+    :return: x_train, y_train as slices of the data set.
+    """
+    size = x.shape[0]
+    sample_size = int(size * percent / 100)
+    step = int(size / sample_size)
+    return x[:size:step], y[:size:step]
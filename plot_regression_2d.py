@@ -9,41 +9,7 @@ import numpy
 from matplotlib import pyplot
 from sklearn.linear_model import LinearRegression
 
-
-def generate_data_set(size=50, seed_x=123, seed_y=321):
-    """
-    Generate data points lying close to a line.
-
-    :param size: the desired size of the generate data set.
-    :param seed_x: seed for random noise to add to the x coordinates of the generated data
-    :param seed_y: seed for random noise to add to the y coordinates of the generated data
-    :return: x, y values as column vectors numpy.ndarray
-    """
-    numpy.random.seed(seed_x)
-    x = numpy.linspace(0, size, size) + numpy.random.uniform(-size * 0.1, size * 0.1, size)
-    numpy.random.seed(seed_y)
-    y = numpy.linspace(0, size, size) + numpy.random.uniform(-size * 0.1, size * 0.1, size)
-    return x.reshape(-1, 1), y.reshape(-1, 1)
-
-
-def partition_data(x: numpy.ndarray, y: numpy.ndarray) -> (numpy.ndarray, numpy.ndarray,
-                                                           numpy.ndarray, numpy.ndarray):
-    """
-    Partition the data set into 3 clusters by
-    sampling 1 third of the data for each of
-    the training set, the test set and the validation set.
-
-    :param x: values of the feature, or input data
-    :param y: values of the target variable
-    :return: slices of the data set as x_train, y_train, x_test, y_test
-    """
-    size = x.shape[0]
-    step = 3
-    x_train = x[:size:step]
-    y_train = y[:size:step]
-    x_test = x[1:size:step]
-    y_test = y[1:size:step]
-    return x_train, y_train, x_test, y_test
+from generators import (generate_data_set, partition_data)
 
 
 def display_results(x: numpy.ndarray, y: numpy.ndarray, model: LinearRegression):